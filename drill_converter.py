@@ -5,497 +5,452 @@ Converts a CSV file of hockey drills into a searchable, filterable HTML page.
 """
 
 import csv
+import hashlib
+import html
+import io
 import json
-import re
+import pickle
+import shutil
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Set
-
-def parse_csv(csv_file: str) -> List[Dict]:
-    """Parse the CSV file and extract drill information."""
-    drills = []
-    
-    with open(csv_file, 'r', encoding='utf-8') as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip header row
-        
-        for row in reader:
-            if len(row) >= 5 and row[0].strip():  # Ensure we have enough columns and drill name
-                drill_name = row[0].strip()
-                theme = row[2].strip() if len(row) > 2 else ""
-                sub_category = row[3].strip() if len(row) > 3 else ""
-                link = row[4].strip() if len(row) > 4 else ""
-                
-                # Parse themes (comma-separated categories)
-                themes = []
-                if theme:
-                    themes = [t.strip() for t in theme.split(',') if t.strip()]
-                
-                # Parse sub-categories (comma-separated categories)
-                sub_categories = []
-                if sub_category:
-                    sub_categories = [t.strip() for t in sub_category.split(',') if t.strip()]
-                
-                # Create tags from themes and sub-categories
-                tags = set()
-                for t in themes:
-                    tags.add(t)
-                for t in sub_categories:
-                    tags.add(t)
-                
-                drill = {
-                    'name': drill_name,
-                    'link': link,
-                    'tags': sorted(list(tags)),
-                    'theme': theme,
-                    'sub_category': sub_category
-                }
-                drills.append(drill)
-    
-    return drills
-
-def get_all_tags(drills: List[Dict]) -> List[str]:
-    """Extract all unique tags from drills."""
-    all_tags = set()
-    for drill in drills:
-        all_tags.update(drill['tags'])
-    return sorted(list(all_tags))
+from typing import Callable, List, Optional, TextIO, Tuple
+
+# Page styles, written next to the HTML so browsers can cache them across visits
+STYLESHEET = """/* ===== Design Tokens (Light) ===== */
+:root {
+    --bg: #0b0c0f;
+    --app-bg: #ffffff;
+    --text: #0f172a;
+    --muted: #465065;
+    --border: #e5e7eb;
+    --elev-1: #ffffff;
+    --elev-2: #f8fafc;
+    --primary: #2563eb;
+    --primary-ink: #ffffff;
+    --ring: 0 0 0 3px rgba(37, 99, 235, .25);
+    --success: #16a34a;
+    --warning: #f59e0b;
+    --danger: #dc2626;
+    --radius: 14px;
+    --shadow-sm: 0 1px 2px rgba(2,6,23,.08);
+    --shadow-md: 0 6px 24px rgba(2,6,23,.08), 0 2px 6px rgba(2,6,23,.06);
+    --shadow-lg: 0 24px 48px rgba(2,6,23,.10);
+}
+
+/* ===== Design Tokens (Dark) ===== */
+.theme-dark {
+    --app-bg: #0b1220;
+    --text: #e5edff;
+    --muted: #9aa6c2;
+    --border: #1e293b;
+    --elev-1: #0e1628;
+    --elev-2: #0b1324;
+    --primary: #60a5fa;
+    --primary-ink: #0b1220;
+    --ring: 0 0 0 3px rgba(96, 165, 250, .25);
+    --success: #34d399;
+    --warning: #fbbf24;
+    --danger: #f87171;
+}
+
+/* ===== Base Reset ===== */
+*, *::before, *::after { box-sizing: border-box; }
+html, body { height: 100%; }
+body {
+    margin: 0;
+    background: var(--bg);
+    color: var(--text);
+    font: 15px/1.6 system-ui, -apple-system, Segoe UI, Roboto, Inter, "Helvetica Neue", Arial, "Noto Sans", "Apple Color Emoji", "Segoe UI Emoji";
+}
+
+/* App frame */
+.app {
+    min-height: 100vh;
+    background: radial-gradient(1200px 600px at 15% -10%, rgba(37,99,235,.10), transparent 60%),
+                radial-gradient(900px 600px at 110% -20%, rgba(16,185,129,.08), transparent 60%),
+                var(--app-bg);
+}
+
+/* ===== Top Nav ===== */
+.topbar {
+    position: sticky; 
+    top: 0; 
+    z-index: 40;
+    backdrop-filter: saturate(120%) blur(8px);
+    background: color-mix(in srgb, var(--app-bg) 82%, transparent);
+    border-bottom: 1px solid var(--border);
+}
+
+.container { 
+    max-width: 1100px; 
+    margin: 0 auto; 
+    padding: 14px 20px; 
+}
+
+.row { 
+    display: flex; 
+    align-items: center; 
+    gap: 12px; 
+    justify-content: space-between; 
+}
+
+.brand { 
+    display: flex; 
+    align-items: center; 
+    gap: 10px; 
+    font-weight: 700; 
+    letter-spacing: .2px; 
+}
+
+.brand .dot { 
+    width: 10px; 
+    height: 10px; 
+    border-radius: 50%; 
+    background: linear-gradient(135deg, var(--primary), #10b981); 
+    box-shadow: 0 0 0 4px color-mix(in srgb, var(--primary) 25%, transparent); 
+}
+
+/* ===== Buttons ===== */
+.btn { 
+    appearance: none; 
+    border: 1px solid var(--border); 
+    background: var(--elev-1); 
+    color: var(--text);
+    padding: 10px 14px; 
+    border-radius: calc(var(--radius) - 6px); 
+    cursor: pointer; 
+    box-shadow: var(--shadow-sm);
+    transition: transform .08s ease, box-shadow .2s ease, background .2s ease, border-color .2s ease;
+    font-size: 14px;
+    font-weight: 500;
+}
+
+.btn:hover { 
+    transform: translateY(-1px); 
+    box-shadow: var(--shadow-md); 
+}
+
+.btn:focus-visible { 
+    outline: none; 
+    box-shadow: var(--shadow-md), var(--ring); 
+}
+
+.btn.primary { 
+    background: var(--primary); 
+    color: var(--primary-ink); 
+    border-color: color-mix(in srgb, var(--primary) 20%, var(--border)); 
+}
+
+.btn.ghost { 
+    background: transparent; 
+}
+
+.btn.danger {
+    background: var(--danger);
+    color: white;
+    border-color: var(--danger);
+}
+
+/* ===== Cards ===== */
+.card { 
+    background: var(--elev-1); 
+    border: 1px solid var(--border); 
+    border-radius: var(--radius); 
+    box-shadow: var(--shadow-md); 
+    overflow: hidden; 
+}
+
+.card .head { 
+    padding: 16px 18px; 
+    border-bottom: 1px solid var(--border); 
+    display: flex; 
+    align-items: center; 
+    justify-content: space-between; 
+    gap: 12px; 
+}
+
+.card .body { 
+    padding: 18px; 
+}
+
+/* ===== Inputs ===== */
+.field { 
+    display: grid; 
+    gap: 6px; 
+}
+
+label { 
+    color: var(--muted); 
+    font-size: 13px; 
+    font-weight: 500;
+}
+
+input, select, textarea {
+    width: 100%; 
+    padding: 10px 12px; 
+    border-radius: calc(var(--radius) - 8px);
+    border: 1px solid var(--border); 
+    background: var(--elev-2); 
+    color: var(--text);
+    box-shadow: inset 0 1px 0 rgba(255,255,255,.06);
+    transition: border-color .2s ease, box-shadow .2s ease;
+}
+
+input:focus, select:focus, textarea:focus { 
+    outline: none; 
+    box-shadow: var(--ring); 
+    border-color: color-mix(in srgb, var(--primary) 40%, var(--border)); 
+}
+
+/* ===== Badge ===== */
+.badge { 
+    display: inline-flex; 
+    align-items: center; 
+    gap: 8px; 
+    padding: 6px 10px; 
+    border-radius: 999px; 
+    border: 1px solid var(--border); 
+    background: var(--elev-2); 
+    font-size: 12px; 
+}
+
+/* ===== Layout ===== */
+.main-content {
+    padding: 26px 20px;
+}
+
+.hero {
+    padding: 32px 20px;
+    text-align: center;
+}
+
+.hero h1 {
+    font-size: clamp(28px, 3.5vw, 42px);
+    margin: 0 0 12px;
+    letter-spacing: -.02em;
+    font-weight: 600;
+}
+
+.hero p {
+    color: var(--muted);
+    margin: 0 auto 22px;
+    max-width: 60ch;
+}
+
+.layout {
+    display: grid;
+    grid-template-columns: 280px 1fr;
+    gap: 30px;
+    align-items: start;
+}
+
+.sidebar {
+    position: sticky;
+    top: 20px;
+    max-height: calc(100vh - 40px);
+    overflow-y: auto;
+}
+
+.sidebar .card {
+    margin-bottom: 0;
+}
+
+.sidebar-section {
+    margin-bottom: 24px;
+}
+
+.sidebar-section:last-child {
+    margin-bottom: 0;
+}
+
+.tags-container {
+    display: flex;
+    flex-direction: column;
+    gap: 6px;
+}
+
+.tag {
+    appearance: none;
+    border: 1px solid var(--border);
+    background: var(--elev-2);
+    color: var(--text);
+    padding: 8px 12px;
+    border-radius: calc(var(--radius) - 8px);
+    cursor: pointer;
+    font-size: 13px;
+    font-weight: 500;
+    text-align: left;
+    width: 100%;
+    transition: all 0.2s ease;
+}
+
+.tag:hover {
+    background: var(--elev-1);
+    transform: translateX(2px);
+}
+
+.tag.active {
+    background: var(--primary);
+    color: var(--primary-ink);
+    border-color: var(--primary);
+    transform: translateX(2px);
+}
+
+.drill-grid {
+    display: flex;
+    flex-direction: column;
+}
+
+.drill-item {
+    padding: 18px 20px;
+    border-bottom: 1px solid var(--border);
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    gap: 20px;
+    transition: background 0.2s ease;
+}
+
+.drill-item.last-visible {
+    border-bottom: none;
+}
+
+.drill-item:hover {
+    background: var(--elev-2);
+}
+
+.drill-name {
+    font-size: 16px;
+    font-weight: 600;
+    flex-shrink: 0;
+}
+
+.drill-name a {
+    color: var(--primary);
+    text-decoration: none;
+    transition: color 0.2s ease;
+}
+
+.drill-name a:hover {
+    color: color-mix(in srgb, var(--primary) 80%, var(--text));
+    text-decoration: underline;
+}
+
+.drill-tags {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 6px;
+    justify-content: flex-end;
+    flex-shrink: 1;
+}
+
+.drill-tag {
+    background: var(--primary);
+    color: var(--primary-ink);
+    padding: 4px 8px;
+    border-radius: calc(var(--radius) - 8px);
+    font-size: 11px;
+    font-weight: 500;
+}
+
+.stats {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 20px;
+    font-size: 14px;
+    color: var(--muted);
+}
+
+.no-results {
+    text-align: center;
+    padding: 60px 20px;
+    color: var(--muted);
+}
+
+.no-results h3 {
+    font-size: 1.5rem;
+    margin-bottom: 10px;
+    color: var(--text);
+}
+
+/* Utility */
+.flex { 
+    display: flex; 
+    gap: 12px; 
+    align-items: center; 
+}
+
+.stack { 
+    display: grid; 
+    gap: 14px; 
+}
+
+/* ===== Responsive ===== */
+@media (max-width: 1024px) {
+    .layout {
+        grid-template-columns: 1fr;
+        gap: 20px;
+    }
+
+    .sidebar {
+        position: static;
+        max-height: none;
+        order: 2;
+    }
+
+    .content {
+        order: 1;
+    }
+
+    .tags-container {
+        flex-direction: row;
+        flex-wrap: wrap;
+        gap: 8px;
+    }
+
+    .tag {
+        width: auto;
+        flex: 0 0 auto;
+    }
+}
+
+@media (max-width: 768px) {
+    .main-content {
+        padding: 20px 15px;
+    }
+
+    .hero {
+        padding: 24px 15px;
+    }
+
+    .drill-item {
+        flex-direction: column;
+        align-items: flex-start;
+        gap: 12px;
+    }
+
+    .drill-tags {
+        justify-content: flex-start;
+        width: 100%;
+    }
+
+    .stats {
+        flex-direction: column;
+        gap: 8px;
+        text-align: center;
+    }
+}
+"""
 
-def generate_html(drills: List[Dict], all_tags: List[str]) -> str:
-    """Generate the HTML page with modern UI and search functionality."""
-    
-    html_template = f"""<!doctype html>
+# Page markup up to the embedded drill data; filled in with str.format
+PAGE_HEADER = """<!doctype html>
 <html lang="en" data-theme="auto">
 <head>
     <meta charset="utf-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1" />
     <title>Hockey Drills Database</title>
-    <style>
-        /* ===== Design Tokens (Light) ===== */
-        :root {{
-            --bg: #0b0c0f;
-            --app-bg: #ffffff;
-            --text: #0f172a;
-            --muted: #465065;
-            --border: #e5e7eb;
-            --elev-1: #ffffff;
-            --elev-2: #f8fafc;
-            --primary: #2563eb;
-            --primary-ink: #ffffff;
-            --ring: 0 0 0 3px rgba(37, 99, 235, .25);
-            --success: #16a34a;
-            --warning: #f59e0b;
-            --danger: #dc2626;
-            --radius: 14px;
-            --shadow-sm: 0 1px 2px rgba(2,6,23,.08);
-            --shadow-md: 0 6px 24px rgba(2,6,23,.08), 0 2px 6px rgba(2,6,23,.06);
-            --shadow-lg: 0 24px 48px rgba(2,6,23,.10);
-        }}
-
-        /* ===== Design Tokens (Dark) ===== */
-        .theme-dark {{
-            --app-bg: #0b1220;
-            --text: #e5edff;
-            --muted: #9aa6c2;
-            --border: #1e293b;
-            --elev-1: #0e1628;
-            --elev-2: #0b1324;
-            --primary: #60a5fa;
-            --primary-ink: #0b1220;
-            --ring: 0 0 0 3px rgba(96, 165, 250, .25);
-            --success: #34d399;
-            --warning: #fbbf24;
-            --danger: #f87171;
-        }}
-
-        /* ===== Base Reset ===== */
-        *, *::before, *::after {{ box-sizing: border-box; }}
-        html, body {{ height: 100%; }}
-        body {{
-            margin: 0;
-            background: var(--bg);
-            color: var(--text);
-            font: 15px/1.6 system-ui, -apple-system, Segoe UI, Roboto, Inter, "Helvetica Neue", Arial, "Noto Sans", "Apple Color Emoji", "Segoe UI Emoji";
-        }}
-
-        /* App frame */
-        .app {{
-            min-height: 100vh;
-            background: radial-gradient(1200px 600px at 15% -10%, rgba(37,99,235,.10), transparent 60%),
-                        radial-gradient(900px 600px at 110% -20%, rgba(16,185,129,.08), transparent 60%),
-                        var(--app-bg);
-        }}
-
-        /* ===== Top Nav ===== */
-        .topbar {{
-            position: sticky; 
-            top: 0; 
-            z-index: 40;
-            backdrop-filter: saturate(120%) blur(8px);
-            background: color-mix(in srgb, var(--app-bg) 82%, transparent);
-            border-bottom: 1px solid var(--border);
-        }}
-        
-        .container {{ 
-            max-width: 1100px; 
-            margin: 0 auto; 
-            padding: 14px 20px; 
-        }}
-        
-        .row {{ 
-            display: flex; 
-            align-items: center; 
-            gap: 12px; 
-            justify-content: space-between; 
-        }}
-        
-        .brand {{ 
-            display: flex; 
-            align-items: center; 
-            gap: 10px; 
-            font-weight: 700; 
-            letter-spacing: .2px; 
-        }}
-        
-        .brand .dot {{ 
-            width: 10px; 
-            height: 10px; 
-            border-radius: 50%; 
-            background: linear-gradient(135deg, var(--primary), #10b981); 
-            box-shadow: 0 0 0 4px color-mix(in srgb, var(--primary) 25%, transparent); 
-        }}
-
-        /* ===== Buttons ===== */
-        .btn {{ 
-            appearance: none; 
-            border: 1px solid var(--border); 
-            background: var(--elev-1); 
-            color: var(--text);
-            padding: 10px 14px; 
-            border-radius: calc(var(--radius) - 6px); 
-            cursor: pointer; 
-            box-shadow: var(--shadow-sm);
-            transition: transform .08s ease, box-shadow .2s ease, background .2s ease, border-color .2s ease;
-            font-size: 14px;
-            font-weight: 500;
-        }}
-        
-        .btn:hover {{ 
-            transform: translateY(-1px); 
-            box-shadow: var(--shadow-md); 
-        }}
-        
-        .btn:focus-visible {{ 
-            outline: none; 
-            box-shadow: var(--shadow-md), var(--ring); 
-        }}
-        
-        .btn.primary {{ 
-            background: var(--primary); 
-            color: var(--primary-ink); 
-            border-color: color-mix(in srgb, var(--primary) 20%, var(--border)); 
-        }}
-        
-        .btn.ghost {{ 
-            background: transparent; 
-        }}
-        
-        .btn.danger {{
-            background: var(--danger);
-            color: white;
-            border-color: var(--danger);
-        }}
-
-        /* ===== Cards ===== */
-        .card {{ 
-            background: var(--elev-1); 
-            border: 1px solid var(--border); 
-            border-radius: var(--radius); 
-            box-shadow: var(--shadow-md); 
-            overflow: hidden; 
-        }}
-        
-        .card .head {{ 
-            padding: 16px 18px; 
-            border-bottom: 1px solid var(--border); 
-            display: flex; 
-            align-items: center; 
-            justify-content: space-between; 
-            gap: 12px; 
-        }}
-        
-        .card .body {{ 
-            padding: 18px; 
-        }}
-
-        /* ===== Inputs ===== */
-        .field {{ 
-            display: grid; 
-            gap: 6px; 
-        }}
-        
-        label {{ 
-            color: var(--muted); 
-            font-size: 13px; 
-            font-weight: 500;
-        }}
-        
-        input, select, textarea {{
-            width: 100%; 
-            padding: 10px 12px; 
-            border-radius: calc(var(--radius) - 8px);
-            border: 1px solid var(--border); 
-            background: var(--elev-2); 
-            color: var(--text);
-            box-shadow: inset 0 1px 0 rgba(255,255,255,.06);
-            transition: border-color .2s ease, box-shadow .2s ease;
-        }}
-        
-        input:focus, select:focus, textarea:focus {{ 
-            outline: none; 
-            box-shadow: var(--ring); 
-            border-color: color-mix(in srgb, var(--primary) 40%, var(--border)); 
-        }}
-
-        /* ===== Badge ===== */
-        .badge {{ 
-            display: inline-flex; 
-            align-items: center; 
-            gap: 8px; 
-            padding: 6px 10px; 
-            border-radius: 999px; 
-            border: 1px solid var(--border); 
-            background: var(--elev-2); 
-            font-size: 12px; 
-        }}
-
-        /* ===== Layout ===== */
-        .main-content {{
-            padding: 26px 20px;
-        }}
-
-        .hero {{
-            padding: 32px 20px;
-            text-align: center;
-        }}
-
-        .hero h1 {{
-            font-size: clamp(28px, 3.5vw, 42px);
-            margin: 0 0 12px;
-            letter-spacing: -.02em;
-            font-weight: 600;
-        }}
-
-        .hero p {{
-            color: var(--muted);
-            margin: 0 auto 22px;
-            max-width: 60ch;
-        }}
-
-        .layout {{
-            display: grid;
-            grid-template-columns: 280px 1fr;
-            gap: 30px;
-            align-items: start;
-        }}
-
-        .sidebar {{
-            position: sticky;
-            top: 20px;
-            max-height: calc(100vh - 40px);
-            overflow-y: auto;
-        }}
-
-        .sidebar .card {{
-            margin-bottom: 0;
-        }}
-
-        .sidebar-section {{
-            margin-bottom: 24px;
-        }}
-
-        .sidebar-section:last-child {{
-            margin-bottom: 0;
-        }}
-
-        .tags-container {{
-            display: flex;
-            flex-direction: column;
-            gap: 6px;
-        }}
-
-        .tag {{
-            appearance: none;
-            border: 1px solid var(--border);
-            background: var(--elev-2);
-            color: var(--text);
-            padding: 8px 12px;
-            border-radius: calc(var(--radius) - 8px);
-            cursor: pointer;
-            font-size: 13px;
-            font-weight: 500;
-            text-align: left;
-            width: 100%;
-            transition: all 0.2s ease;
-        }}
-
-        .tag:hover {{
-            background: var(--elev-1);
-            transform: translateX(2px);
-        }}
-
-        .tag.active {{
-            background: var(--primary);
-            color: var(--primary-ink);
-            border-color: var(--primary);
-            transform: translateX(2px);
-        }}
-
-        .drill-grid {{
-            display: flex;
-            flex-direction: column;
-        }}
-
-        .drill-item {{
-            padding: 18px 20px;
-            border-bottom: 1px solid var(--border);
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            gap: 20px;
-            transition: background 0.2s ease;
-        }}
-
-        .drill-item:last-child {{
-            border-bottom: none;
-        }}
-
-        .drill-item:hover {{
-            background: var(--elev-2);
-        }}
-
-        .drill-name {{
-            font-size: 16px;
-            font-weight: 600;
-            flex-shrink: 0;
-        }}
-
-        .drill-name a {{
-            color: var(--primary);
-            text-decoration: none;
-            transition: color 0.2s ease;
-        }}
-
-        .drill-name a:hover {{
-            color: color-mix(in srgb, var(--primary) 80%, var(--text));
-            text-decoration: underline;
-        }}
-
-        .drill-tags {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 6px;
-            justify-content: flex-end;
-            flex-shrink: 1;
-        }}
-
-        .drill-tag {{
-            background: var(--primary);
-            color: var(--primary-ink);
-            padding: 4px 8px;
-            border-radius: calc(var(--radius) - 8px);
-            font-size: 11px;
-            font-weight: 500;
-        }}
-
-        .stats {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            font-size: 14px;
-            color: var(--muted);
-        }}
-
-        .no-results {{
-            text-align: center;
-            padding: 60px 20px;
-            color: var(--muted);
-        }}
-
-        .no-results h3 {{
-            font-size: 1.5rem;
-            margin-bottom: 10px;
-            color: var(--text);
-        }}
-
-        /* Utility */
-        .flex {{ 
-            display: flex; 
-            gap: 12px; 
-            align-items: center; 
-        }}
-        
-        .stack {{ 
-            display: grid; 
-            gap: 14px; 
-        }}
-
-        /* ===== Responsive ===== */
-        @media (max-width: 1024px) {{
-            .layout {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-            }}
-
-            .sidebar {{
-                position: static;
-                max-height: none;
-                order: 2;
-            }}
-
-            .content {{
-                order: 1;
-            }}
-
-            .tags-container {{
-                flex-direction: row;
-                flex-wrap: wrap;
-                gap: 8px;
-            }}
-
-            .tag {{
-                width: auto;
-                flex: 0 0 auto;
-            }}
-        }}
-
-        @media (max-width: 768px) {{
-            .main-content {{
-                padding: 20px 15px;
-            }}
-
-            .hero {{
-                padding: 24px 15px;
-            }}
-
-            .drill-item {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 12px;
-            }}
-
-            .drill-tags {{
-                justify-content: flex-start;
-                width: 100%;
-            }}
-
-            .stats {{
-                flex-direction: column;
-                gap: 8px;
-                text-align: center;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{stylesheet}">
 </head>
 <body>
     <div class="app">
@@ -506,7 +461,7 @@ def generate_html(drills: List[Dict], all_tags: List[str]) -> str:
                     <div class="brand">
                         <span class="dot" aria-hidden="true"></span>
                         <span>Hockey Drills</span>
-                        <span class="badge">{len(drills)} drills</span>
+                        <span class="badge">{drill_count} drills</span>
                     </div>
                     <div class="flex">
                         <button class="btn ghost" id="themeToggle" aria-label="Toggle theme">
@@ -524,7 +479,7 @@ def generate_html(drills: List[Dict], all_tags: List[str]) -> str:
         <section class="hero">
             <div class="container">
                 <h1>Hockey Drills Database</h1>
-                <p>Search and filter through {len(drills)} professional hockey drills with {len(all_tags)} categories</p>
+                <p>Search and filter through {drill_count} professional hockey drills with {tag_count} categories</p>
             </div>
         </section>
 
@@ -561,7 +516,7 @@ def generate_html(drills: List[Dict], all_tags: List[str]) -> str:
                     <!-- ===== Main Content ===== -->
                     <main class="content">
                         <div class="stats">
-                            <span id="resultsCount">Showing {len(drills)} drills</span>
+                            <span id="resultsCount">Showing {drill_count} drills</span>
                             <span id="activeFilters">No filters active</span>
                         </div>
 
@@ -583,12 +538,16 @@ def generate_html(drills: List[Dict], all_tags: List[str]) -> str:
 
     <script>
         // Data
-        const drills = {json.dumps(drills, indent=2)};
-        const allTags = {json.dumps(all_tags, indent=2)};
-        
+        const drills = """
+
+# Client script following the embedded data, through the end of the page
+PAGE_SCRIPT = """        
         // State
         let activeFilters = new Set();
         let searchTerm = '';
+        let searchTimer;
+        const drillRows = new Map();
+        const allDrillIds = drills.map((drill, id) => id);
 
         // DOM Elements
         const searchBox = document.getElementById('searchBox');
@@ -599,136 +558,362 @@ def generate_html(drills: List[Dict], all_tags: List[str]) -> str:
         const activeFiltersSpan = document.getElementById('activeFilters');
 
         // Initialize
-        function init() {{
+        function init() {
             renderTags();
+            buildDrillRows();
             renderDrills();
             setupEventListeners();
-        }}
-
-        function setupEventListeners() {{
-            searchBox.addEventListener('input', (e) => {{
-                searchTerm = e.target.value.toLowerCase();
-                renderDrills();
-            }});
-        }}
-
-        function renderTags() {{
-            tagsContainer.innerHTML = allTags.map(tag => 
-                `<span class="tag" onclick="toggleFilter('${{tag}}')" data-tag="${{tag}}">${{tag}}</span>`
+        }
+
+        function setupEventListeners() {
+            // Debounce so a burst of keystrokes triggers a single render
+            searchBox.addEventListener('input', (e) => {
+                clearTimeout(searchTimer);
+                const value = e.target.value.toLowerCase();
+                searchTimer = setTimeout(() => {
+                    searchTerm = value;
+                    renderDrills();
+                }, 80);
+            });
+        }
+
+        function renderTags() {
+            tagsContainer.innerHTML = allTags.map((tag, id) => 
+                `<span class="tag" onclick="toggleFilter(${id})" data-tag="${id}">${tag}</span>`
             ).join('');
-        }}
+        }
 
-        function toggleFilter(tag) {{
-            if (activeFilters.has(tag)) {{
+        function toggleFilter(tag) {
+            if (activeFilters.has(tag)) {
                 activeFilters.delete(tag);
-            }} else {{
+            } else {
                 activeFilters.add(tag);
-            }}
+            }
             updateTagStyles();
             renderDrills();
-        }}
+        }
 
-        function updateTagStyles() {{
-            document.querySelectorAll('.tag').forEach(tagEl => {{
-                const tag = tagEl.dataset.tag;
-                if (activeFilters.has(tag)) {{
+        function updateTagStyles() {
+            document.querySelectorAll('.tag').forEach(tagEl => {
+                const tag = Number(tagEl.dataset.tag);
+                if (activeFilters.has(tag)) {
                     tagEl.classList.add('active');
-                }} else {{
+                } else {
                     tagEl.classList.remove('active');
-                }}
-            }});
-        }}
+                }
+            });
+        }
 
-        function clearAllFilters() {{
+        function clearAllFilters() {
             activeFilters.clear();
+            clearTimeout(searchTimer);
             searchTerm = '';
             searchBox.value = '';
             updateTagStyles();
             renderDrills();
-        }}
-
-        function renderDrills() {{
-            const filteredDrills = drills.filter(drill => {{
-                // Search filter
-                const matchesSearch = !searchTerm || 
-                    drill.name.toLowerCase().includes(searchTerm) ||
-                    drill.tags.some(tag => tag.toLowerCase().includes(searchTerm));
-
-                // Tag filters
-                const matchesTags = activeFilters.size === 0 || 
-                    [...activeFilters].every(filter => drill.tags.includes(filter));
-
-                return matchesSearch && matchesTags;
-            }});
-
-            if (filteredDrills.length === 0) {{
+        }
+
+        // Drill rows are created once, in a single innerHTML parse; renders only toggle their visibility
+        function buildDrillRows() {
+            const tagHtml = allTags.map(tag => `<span class="drill-tag">${tag}</span>`);
+            drillGrid.innerHTML = drills.map(drill => `
+                <div class="drill-item">
+                    <div class="drill-name">
+                        ${drill.link_h ? `<a href="${drill.link_h}" target="_blank">${drill.name_h}</a>` : drill.name_h}
+                    </div>
+                    <div class="drill-tags">
+                        ${drill.t.map(tagId => tagHtml[tagId]).join('')}
+                    </div>
+                </div>
+            `).join('');
+            [...drillGrid.children].forEach((row, id) => drillRows.set(id, row));
+        }
+
+        function renderDrills() {
+            // Tag filters: intersect posting lists, starting from the shortest
+            let candidates = allDrillIds;
+            if (activeFilters.size > 0) {
+                const [shortest, ...rest] = [...activeFilters]
+                    .map(id => tagIndex[id])
+                    .sort((a, b) => a.length - b.length);
+                const restSets = rest.map(ids => new Set(ids));
+                candidates = shortest.filter(id => restSets.every(ids => ids.has(id)));
+            }
+
+            // Search filter
+            const filteredIds = searchTerm
+                ? candidates.filter(id => drills[id].s.includes(searchTerm))
+                : candidates;
+
+            if (filteredIds.length === 0) {
                 drillGrid.style.display = 'none';
                 noResults.style.display = 'block';
-            }} else {{
+            } else {
                 drillGrid.style.display = 'block';
                 noResults.style.display = 'none';
                 
-                drillGrid.innerHTML = filteredDrills.map(drill => `
-                    <div class="drill-item">
-                        <div class="drill-name">
-                            ${{drill.link ? `<a href="${{drill.link}}" target="_blank">${{drill.name}}</a>` : drill.name}}
-                        </div>
-                        <div class="drill-tags">
-                            ${{drill.tags.map(tag => `<span class="drill-tag">${{tag}}</span>`).join('')}}
-                        </div>
-                    </div>
-                `).join('');
-            }}
-
-            updateStats(filteredDrills.length);
-        }}
-
-        function updateStats(count) {{
-            resultsCount.textContent = `Showing ${{count}} drill${{count !== 1 ? 's' : ''}}`;
+                // Hidden rows stay in the DOM, so :last-child cannot find the last visible one
+                const visible = new Set(filteredIds);
+                const lastId = filteredIds[filteredIds.length - 1];
+                drillRows.forEach((row, id) => {
+                    row.style.display = visible.has(id) ? '' : 'none';
+                    row.classList.toggle('last-visible', id === lastId);
+                });
+            }
+
+            updateStats(filteredIds.length);
+        }
+
+        function updateStats(count) {
+            resultsCount.textContent = `Showing ${count} drill${count !== 1 ? 's' : ''}`;
             
-            if (activeFilters.size > 0) {{
-                activeFiltersSpan.textContent = `${{activeFilters.size}} filter${{activeFilters.size !== 1 ? 's' : ''}} active: ${{[...activeFilters].join(', ')}}`;
-            }} else {{
+            if (activeFilters.size > 0) {
+                activeFiltersSpan.innerHTML = `${activeFilters.size} filter${activeFilters.size !== 1 ? 's' : ''} active: ${[...activeFilters].map(id => allTags[id]).join(', ')}`;
+            } else {
                 activeFiltersSpan.textContent = 'No filters active';
-            }}
-        }}
+            }
+        }
 
         // Initialize the app
         init();
 
         // ===== Theme Logic: respects system, remembers choice, toggles on click =====
-        (function () {{
+        (function () {
             const root = document.documentElement;
             const pref = localStorage.getItem('theme') || 'auto';
             const mq = window.matchMedia('(prefers-color-scheme: dark)');
 
-            function apply(theme) {{
+            function apply(theme) {
                 root.classList.toggle('theme-dark', theme === 'dark' || (theme === 'auto' && mq.matches));
                 root.dataset.theme = theme;
-            }}
+            }
 
             mq.addEventListener?.('change', () => apply(root.dataset.theme || 'auto'));
 
             apply(pref);
-            document.getElementById('themeToggle').addEventListener('click', () => {{
+            document.getElementById('themeToggle').addEventListener('click', () => {
                 const order = ['auto','light','dark'];
                 const next = order[(order.indexOf(root.dataset.theme || 'auto') + 1) % order.length];
                 localStorage.setItem('theme', next); 
                 apply(next);
                 const label = next[0].toUpperCase() + next.slice(1);
                 document.getElementById('themeToggle').lastChild.textContent = ' ' + label;
-            }});
-        }})();
+            });
+        })();
     </script>
 </body>
 </html>"""
 
-    return html_template
+@dataclass(slots=True)
+class Drill:
+    """A single drill parsed from the CSV."""
+    name: str
+    link: str
+    tags: Tuple[str, ...]
+    search: str  # Lowercase name and tags; newlines keep matches from spanning them
+
+def _read_rows_pyarrow(csv_file: str) -> Optional[List[List[str]]]:
+    """Read the data rows with pyarrow, or return None when it is unavailable or could differ from csv's."""
+    # Imported here so runs that never parse (cache hits) do not pay for loading pyarrow
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:  # pyarrow is optional; fall back to the pure Python reader
+        return None
+    
+    # pyarrow fixes the row width from the first data row and rejects rows of any other width
+    skipped = []
+    def on_invalid_row(row):
+        skipped.append(row)
+        return 'skip'
+    
+    columns = [f'f{i}' for i in range(5)]
+    try:
+        table = pa_csv.read_csv(
+            csv_file,
+            # A one-shot read of a small file gains nothing from the thread pool, whose teardown
+            # has been seen to abort the interpreter at exit
+            read_options=pa_csv.ReadOptions(skip_rows=1, autogenerate_column_names=True, use_threads=False),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=on_invalid_row),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={name: pa.string() for name in columns},
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowException:  # Empty file, or a first data row narrower than five columns
+        return None
+    
+    if skipped:
+        return None
+    return [list(row) for row in zip(*(table.column(name).to_pylist() for name in columns))]
+
+def read_rows(csv_file: str) -> List[List[str]]:
+    """Read the data rows (header skipped) of the CSV file, first five columns only."""
+    rows = _read_rows_pyarrow(csv_file)
+    if rows is not None:
+        return rows
+    
+    text = Path(csv_file).read_text(encoding='utf-8')
+    
+    # Quoted cells may hold commas or span lines, so any quote sends the whole file through csv
+    if '"' in text:
+        return list(csv.reader(io.StringIO(text)))[1:]  # Skip header row
+    
+    lines = text.split('\n')
+    return [line.removesuffix('\r').split(',', 5) for line in lines[1:]]  # Skip header row
+
+def parse_csv(csv_file: str) -> List[Drill]:
+    """Parse the CSV file and extract drill information."""
+    drills = []
+    
+    # Share one string object per distinct tag across all drills
+    interned = {}
+    def _i(tag: str) -> str:
+        return interned.setdefault(tag, tag)
+    
+    for row in read_rows(csv_file):
+        if len(row) >= 5 and row[0].strip():  # Ensure we have enough columns and drill name
+            drill_name = row[0].strip()
+            theme = row[2].strip()
+            sub_category = row[3].strip()
+            link = row[4].strip()
+            
+            # Tags are the union of the comma-separated themes and sub-categories
+            tags = sorted({_i(t) for s in f'{theme},{sub_category}'.split(',') if (t := s.strip())})
+            
+            drills.append(Drill(
+                name=drill_name,
+                link=link,
+                tags=tuple(tags),
+                search='\n'.join([drill_name, *tags]).lower()
+            ))
+    
+    return drills
+
+def get_all_tags(drills: List[Drill]) -> List[str]:
+    """Extract all unique tags from drills."""
+    return sorted(set().union(*(drill.tags for drill in drills)))
+
+def load_drills(csv_file: str, cache_file: str) -> Tuple[List[Drill], List[str]]:
+    """Parse drills and tags from the CSV, reusing the pickled results while they are current."""
+    # The cache is stale once either the CSV or this script changes
+    key = (Path(csv_file).stat().st_mtime_ns, Path(__file__).stat().st_mtime_ns)
+    cache = Path(cache_file)
+    
+    if cache.exists():
+        try:
+            with open(cache, 'rb') as f:
+                cached_key, drills, all_tags = pickle.load(f)
+            if cached_key == key:
+                return drills, all_tags
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            pass  # Unreadable cache; rebuild it below
+    
+    drills = parse_csv(csv_file)
+    all_tags = get_all_tags(drills)
+    try:
+        with open(cache, 'wb') as f:
+            pickle.dump((key, drills, all_tags), f)
+    except OSError:
+        pass  # The cache is only an optimisation, e.g. in a read-only checkout
+    
+    return drills, all_tags
+
+# JSON string escapes for characters that could end or confuse an inline <script> block
+_SCRIPT_JSON_ESCAPES = str.maketrans({'<': '\\u003c', '>': '\\u003e', '&': '\\u0026'})
+
+def _dump_script_json(obj, f: TextIO) -> None:
+    """Stream obj as compact JSON that is safe to embed in an inline <script> block."""
+    for chunk in json.JSONEncoder(separators=(',', ':')).iterencode(obj):
+        f.write(chunk.translate(_SCRIPT_JSON_ESCAPES))
+
+def write_html(drills: List[Drill], all_tags: List[str], f: TextIO, stylesheet: str = "hockey_drills.css") -> None:
+    """Write the HTML page with modern UI and search functionality, streaming the drill data."""
+    
+    # Drills reference tags by their index in all_tags instead of repeating the strings.
+    # Names, links and tags are HTML-escaped here since the page injects them via innerHTML.
+    tag_to_id = {tag: i for i, tag in enumerate(all_tags)}
+    client_tags = [html.escape(tag) for tag in all_tags]
+    client_drills = [
+        {
+            'name_h': html.escape(drill.name),
+            'link_h': html.escape(drill.link, quote=True),
+            't': [tag_to_id[tag] for tag in drill.tags],
+            's': drill.search
+        }
+        for drill in drills
+    ]
+    
+    # Inverted index: tag_index[tag_id] lists the drills carrying that tag, in drill order
+    tag_index = [[] for _ in all_tags]
+    for drill_id, drill in enumerate(client_drills):
+        for tag_id in drill['t']:
+            tag_index[tag_id].append(drill_id)
+    
+    f.write(PAGE_HEADER.format(stylesheet=stylesheet, drill_count=len(drills), tag_count=len(all_tags)))
+    _dump_script_json(client_drills, f)
+    f.write(';\n        const allTags = ')
+    _dump_script_json(client_tags, f)
+    f.write(';\n        const tagIndex = ')
+    _dump_script_json(tag_index, f)
+    f.write(';\n')
+    f.write(PAGE_SCRIPT)
+
+class _NullWriter:
+    """Text sink that discards everything written to it."""
+    def write(self, text: str) -> None:
+        pass
+
+class _HashingWriter:
+    """Text stream wrapper that feeds everything written through it into a BLAKE2b digest."""
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.hash = hashlib.blake2b()
+    
+    def write(self, text: str) -> None:
+        self.hash.update(text.encode('utf-8'))
+        self.f.write(text)
+
+def _file_digest(path: Path) -> bytes:
+    """BLAKE2b digest of a file, read in chunks."""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 16):
+            digest.update(chunk)
+    return digest.digest()
+
+def write_if_changed(output_file: str, render: Callable[[TextIO], None]) -> bool:
+    """Write output_file with render() unless the result matches the existing file byte for byte."""
+    path = Path(output_file)
+    
+    # Hash-only pass first, so an unchanged file leaves the directory untouched
+    if path.exists():
+        sink = _HashingWriter(_NullWriter())
+        render(sink)
+        if _file_digest(path) == sink.hash.digest():
+            return False
+    
+    # newline='\n' keeps the bytes on disk identical to what gets hashed on the next run
+    tmp = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+            render(f)
+        if path.exists():
+            shutil.copymode(path, tmp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    
+    tmp.replace(path)
+    return True
 
 def main():
     """Main function to convert CSV to HTML."""
     csv_file = "2025-26 B Red Practice Plan - Drills.csv"
     output_file = "hockey_drills.html"
+    css_file = "hockey_drills.css"
+    cache_file = ".drill_cache.pkl"
     
     # Check if CSV file exists
     if not Path(csv_file).exists():
@@ -736,21 +921,19 @@ def main():
         return
     
     print(f"Reading drills from {csv_file}...")
-    drills = parse_csv(csv_file)
+    drills, all_tags = load_drills(csv_file, cache_file)
     print(f"Found {len(drills)} drills")
-    
-    print("Extracting tags...")
-    all_tags = get_all_tags(drills)
     print(f"Found {len(all_tags)} unique tags")
     
-    print("Generating HTML...")
-    html_content = generate_html(drills, all_tags)
+    print(f"Writing stylesheet to {css_file}...")
+    if not write_if_changed(css_file, lambda f: f.write(STYLESHEET)):
+        print(f"{css_file} is unchanged, skipped writing")
     
     print(f"Writing HTML to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"Successfully created {output_file}")
+    if write_if_changed(output_file, lambda f: write_html(drills, all_tags, f, css_file)):
+        print(f"Successfully created {output_file}")
+    else:
+        print(f"{output_file} is unchanged, skipped writing")
     print(f"Processed {len(drills)} drills with {len(all_tags)} unique tags")
     print(f"Open {output_file} in your browser to view the searchable drill database")
 